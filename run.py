@@ -6,6 +6,9 @@ import os
 sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
 
 def main():
+    from src.cli._logging import configure_logging
+    configure_logging()
+    
     print("Cloud Resource Management System")
     print("=" * 50)
     print("1. Run Simple CLI (no authentication)")
@@ -25,9 +28,7 @@ def main():
         app.run()
     elif choice == "3":
         from src.cli import demo_resource_manager
-        demo_resource_manager.demo_file_login()
-        demo_resource_manager.demo_service_login()
-        demo_resource_manager.demo_repository_operations()
+        demo_resource_manager.run_all_demos()
     elif choice == "4":
         print("Goodbye!")
         sys.exit(0)
@@ -0,0 +1,30 @@
+"""Prompting helpers for resource configuration fields."""
+import re
+
+# key=value pairs accepted on a single batch-mode input line
+FIELD_RE = re.compile(r"(\w+)=(\S+)")
+
+
+def yes_no(answer):
+    """Interpret a y/n answer."""
+    return answer.lower() == 'y'
+
+
+def prompt_fields(first_line, spec):
+    """Build a resource config from user input.
+    
+    spec is a list of (field, coerce, prompt) tuples. If first_line contains
+    key=value pairs they are used directly and only missing fields are
+    prompted for; otherwise first_line is taken as the resource name and each
+    field is prompted for in turn.
+    """
+    if "=" in first_line:
+        values = dict(FIELD_RE.findall(first_line))
+    else:
+        values = {'name': first_line}
+    
+    config = {'name': values['name'] if 'name' in values else input("Enter resource name: ").strip()}
+    for field, coerce, prompt in spec:
+        raw = values[field] if field in values else input(prompt).strip()
+        config[field] = coerce(raw)
+    return config
@@ -0,0 +1,10 @@
+"""Logging setup shared by the CLI entry points."""
+import logging
+from src.patterns.resource_decorator import StdoutHandler
+
+
+def configure_logging(level=logging.INFO):
+    """Show service log messages on stdout, interleaved with the CLI's prints."""
+    handler = StdoutHandler()
+    handler.setFormatter(logging.Formatter("%(message)s"))
+    logging.basicConfig(level=level, handlers=[handler])
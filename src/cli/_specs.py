@@ -0,0 +1,21 @@
+"""Configuration field specs for each resource type offered by the CLIs."""
+from typing import Callable, Dict, List, Tuple
+from src.cli._fields import yes_no
+
+# resource type -> [(config field, coercion, interactive prompt), ...]
+RESOURCE_SPECS: Dict[str, List[Tuple[str, Callable[[str], object], str]]] = {
+    "AppService": [
+        ('runtime', str, "Enter runtime (e.g., Python, Node.js): "),
+        ('region', str, "Enter region (e.g., us-east-1): "),
+        ('replica_count', int, "Enter replica count: "),
+    ],
+    "StorageAccount": [
+        ('encryption_enabled', yes_no, "Enable encryption? (y/n): "),
+        ('max_size_gb', int, "Enter max size (GB): "),
+    ],
+    "CacheDB": [
+        ('ttl_seconds', int, "Enter TTL (seconds): "),
+        ('capacity_mb', int, "Enter capacity (MB): "),
+        ('eviction_policy', str.upper, "Enter eviction policy (LRU/FIFO): "),
+    ],
+}
@@ -1,17 +1,41 @@
 """Demo script showing the resource manager with repository pattern."""
+import contextlib
+import io
+import sys
+from typing import Optional
+from src.patterns.resource_decorator import synchronous_logs
 from src.services.resource_manager import ResourceManager
 from src.services.user_repository import UserRepository, User
 from src.services.login_service import FileLogin, ServiceLogin
+from src.cli._logging import configure_logging
 
+DEMO_USERS_PATH = "data/demo_users.json"
 
-def demo_file_login():
+
+@contextlib.contextmanager
+def _buffered_output():
+    """Collect a demo's output in memory and write it to stdout in one go."""
+    buf = io.StringIO()
+    try:
+        # Decorator logs are written synchronously so they stay next to the
+        # step that caused them
+        with contextlib.redirect_stdout(buf), synchronous_logs():
+            yield
+    finally:
+        sys.stdout.write(buf.getvalue())
+        sys.stdout.flush()
+
+
+@_buffered_output()
+def demo_file_login(repo: Optional[UserRepository] = None):
     """Demonstrate file-based login."""
     print("="*60)
     print("DEMO: File-Based Login with Repository Pattern")
     print("="*60)
     
     # Initialize repository and login service
-    repo = UserRepository("data/demo_users.json")
+    if repo is None:
+        repo = UserRepository(DEMO_USERS_PATH)
     file_login = FileLogin(repo)
     
     # Create resource manager
@@ -45,8 +69,8 @@ def demo_file_login():
     # List resources
     print("\n5. Listing all resources...")
     resources = manager.list_resources()
-    for rid, resource in resources.items():
-        print(f"  [{rid}] {resource.name} - State: {resource.get_state()}")
+    sys.stdout.write("".join(f"  [{rid}] {resource.name} - State: {resource.get_state()}\n"
+                             for rid, resource in resources.items()))
     
     # Start the resource
     print("\n6. Starting the resource...")
@@ -73,14 +97,16 @@ def demo_file_login():
     print(f"Result: {result}")
 
 
-def demo_service_login():
+@_buffered_output()
+def demo_service_login(repo: Optional[UserRepository] = None):
     """Demonstrate service-based login."""
     print("\n\n" + "="*60)
     print("DEMO: Service-Based Login")
     print("="*60)
     
     # Initialize repository and service login
-    repo = UserRepository("data/demo_users.json")
+    if repo is None:
+        repo = UserRepository(DEMO_USERS_PATH)
     service_login = ServiceLogin("https://auth.example.com", "api-key-xyz")
     
     # Create resource manager with service login
@@ -110,18 +136,19 @@ def demo_service_login():
         print(details)
 
 
-def demo_repository_operations():
+@_buffered_output()
+def demo_repository_operations(repo: Optional[UserRepository] = None):
     """Demonstrate repository CRUD operations."""
     print("\n\n" + "="*60)
     print("DEMO: Repository CRUD Operations")
     print("="*60)
     
-    repo = UserRepository("data/demo_users.json")
+    if repo is None:
+        repo = UserRepository(DEMO_USERS_PATH)
     
     print("\n1. Getting all users...")
     users = repo.get_all_users()
-    for user in users:
-        print(f"  - {user.username} ({user.role})")
+    sys.stdout.write("".join(f"  - {user.username} ({user.role})\n" for user in users))
     
     print("\n2. Finding user by username...")
     user = repo.find_by_username("alice")
@@ -143,14 +170,20 @@ def demo_repository_operations():
     
     print("\n6. Final user list...")
     users = repo.get_all_users()
-    for user in users:
-        print(f"  - {user.username} ({user.role})")
+    sys.stdout.write("".join(f"  - {user.username} ({user.role})\n" for user in users))
+
+
+def run_all_demos():
+    """Run every demo against one shared repository."""
+    repo = UserRepository(DEMO_USERS_PATH)
+    demo_file_login(repo)
+    demo_service_login(repo)
+    demo_repository_operations(repo)
 
 
 if __name__ == "__main__":
-    demo_file_login()
-    demo_service_login()
-    demo_repository_operations()
+    configure_logging()
+    run_all_demos()
     
     print("\n\n" + "="*60)
     print("Demo completed! Check 'demo_users.json' for persisted data.")
@@ -1,57 +1,72 @@
 """Main CLI application for cloud resource management."""
-from src.patterns.resource_factory import ResourceFactory
-from src.patterns.resource_decorator import LoggingDecorator
+import sys
+from src.patterns.resource_factory import DEFAULT_FACTORY
+from src.patterns.resource_decorator import LoggingDecorator, synchronous_logs
+from src.cli._fields import prompt_fields
+from src.cli._specs import RESOURCE_SPECS
+from src.cli._logging import configure_logging
 
 
 class CloudResourceManager:
     """Main application for managing cloud resources."""
     
     def __init__(self):
-        self.factory = ResourceFactory()
-        self.resources = {}
-        self.next_id = 1
+        # Same registry as ResourceManager, so both CLIs offer the same types
+        self.factory = DEFAULT_FACTORY
+        self._resource_types = None
+        # Resource IDs are 1-based positions in this list; deleted resources
+        # keep their slot, so IDs stay stable.
+        self.resources = []
+        self._menu = {
+            "1": self.create_resource,
+            "2": self.list_resources,
+            "3": self.start_resource,
+            "4": self.stop_resource,
+            "5": self.delete_resource,
+            "6": self.view_details,
+        }
+    
+    @property
+    def resource_types(self):
+        """Registered resource type names, read from the factory once."""
+        if self._resource_types is None:
+            self._resource_types = tuple(self.factory.list_available_types())
+        return self._resource_types
     
     def run(self):
         """Run the main menu loop."""
-        while True:
-            print("\n" + "="*50)
-            print("Cloud Resource Management System")
-            print("="*50)
-            print("1. Create Resource")
-            print("2. List Resources")
-            print("3. Start Resource")
-            print("4. Stop Resource")
-            print("5. Delete Resource")
-            print("6. View Resource Details")
-            print("7. Exit")
-            
-            choice = input("\nEnter your choice: ").strip()
-            
-            try:
-                if choice == "1":
-                    self.create_resource()
-                elif choice == "2":
-                    self.list_resources()
-                elif choice == "3":
-                    self.start_resource()
-                elif choice == "4":
-                    self.stop_resource()
-                elif choice == "5":
-                    self.delete_resource()
-                elif choice == "6":
-                    self.view_details()
-                elif choice == "7":
-                    print("Exiting...")
-                    break
-                else:
-                    print("Invalid choice. Please try again.")
-            except Exception as e:
-                print(f"Error: {str(e)}")
+        # Decorator logs are written synchronously so they land before the next prompt
+        with synchronous_logs():
+            while True:
+                print("\n" + "="*50)
+                print("Cloud Resource Management System")
+                print("="*50)
+                print("1. Create Resource")
+                print("2. List Resources")
+                print("3. Start Resource")
+                print("4. Stop Resource")
+                print("5. Delete Resource")
+                print("6. View Resource Details")
+                print("7. Exit")
+                
+                choice = input("\nEnter your choice: ").strip()
+                
+                try:
+                    handler = self._menu.get(choice)
+                    if handler:
+                        handler()
+                    elif choice == "7":
+                        print("Exiting...")
+                        break
+                    else:
+                        print("Invalid choice. Please try again.")
+                except Exception as e:
+                    print(f"Error: {str(e)}")
     
     def create_resource(self):
         """Create a new resource."""
         print("\nAvailable resource types:")
-        types = self.factory.list_available_types()
+        types = self.resource_types
         for i, rtype in enumerate(types, 1):
             print(f"{i}. {rtype}")
         
@@ -62,21 +77,11 @@ class CloudResourceManager:
             print("Invalid selection")
             return
         
-        name = input("Enter resource name: ").strip()
-        
-        config = {'id': str(self.next_id), 'name': name}
+        # Either just the name, or the whole config as key=value pairs
+        first_line = input("Enter resource name (or key=value fields): ").strip()
         
-        if resource_type == "AppService":
-            config['runtime'] = input("Enter runtime (e.g., Python, Node.js): ").strip()
-            config['region'] = input("Enter region (e.g., us-east-1): ").strip()
-            config['replica_count'] = int(input("Enter replica count: ").strip())
-        elif resource_type == "StorageAccount":
-            config['encryption_enabled'] = input("Enable encryption? (y/n): ").strip().lower() == 'y'
-            config['max_size_gb'] = int(input("Enter max size (GB): ").strip())
-        elif resource_type == "CacheDB":
-            config['ttl_seconds'] = int(input("Enter TTL (seconds): ").strip())
-            config['capacity_mb'] = int(input("Enter capacity (MB): ").strip())
-            config['eviction_policy'] = input("Enter eviction policy (LRU/FIFO): ").strip().upper()
+        config = prompt_fields(first_line, RESOURCE_SPECS.get(resource_type, ()))
+        config['id'] = str(len(self.resources) + 1)
         
         resource = self.factory.create_resource(resource_type, config)
         
@@ -85,8 +90,7 @@ class CloudResourceManager:
         if enable_logging:
             resource = LoggingDecorator(resource)
         
-        self.resources[str(self.next_id)] = resource
-        self.next_id += 1
+        self.resources.append(resource)
         print(f"\nResource created successfully with ID: {config['id']}")
     
     def list_resources(self):
@@ -95,43 +99,55 @@ class CloudResourceManager:
             print("\nNo resources available.")
             return
         
-        print("\nResources:")
-        for rid, resource in self.resources.items():
-            print(f"  [{rid}] {resource.name} - State: {resource.get_state()}")
+        lines = ["\nResources:"]
+        lines.extend(f"  [{rid}] {resource.name} - State: {resource.get_state()}"
+                     for rid, resource in enumerate(self.resources, 1))
+        sys.stdout.write("\n".join(lines) + "\n")
+    
+    def _find_resource(self, rid):
+        """Return the resource with the given ID, or None if there is none."""
+        try:
+            index = int(rid) - 1
+        except ValueError:
+            return None
+        if 0 <= index < len(self.resources):
+            return self.resources[index]
+        return None
     
     def start_resource(self):
         """Start a resource."""
-        rid = input("Enter resource ID: ").strip()
-        if rid in self.resources:
-            self.resources[rid].start()
+        resource = self._find_resource(input("Enter resource ID: ").strip())
+        if resource:
+            resource.start()
         else:
             print("Resource not found")
     
     def stop_resource(self):
         """Stop a resource."""
-        rid = input("Enter resource ID: ").strip()
-        if rid in self.resources:
-            self.resources[rid].stop()
+        resource = self._find_resource(input("Enter resource ID: ").strip())
+        if resource:
+            resource.stop()
         else:
             print("Resource not found")
     
     def delete_resource(self):
         """Delete a resource."""
-        rid = input("Enter resource ID: ").strip()
-        if rid in self.resources:
-            self.resources[rid].delete()
+        resource = self._find_resource(input("Enter resource ID: ").strip())
+        if resource:
+            resource.delete()
         else:
             print("Resource not found")
     
     def view_details(self):
         """View resource details."""
-        rid = input("Enter resource ID: ").strip()
-        if rid in self.resources:
-            print("\n" + self.resources[rid].get_details())
+        resource = self._find_resource(input("Enter resource ID: ").strip())
+        if resource:
+            print("\n" + resource.get_details())
         else:
             print("Resource not found")
 
 
 if __name__ == "__main__":
+    configure_logging()
     manager = CloudResourceManager()
     manager.run()
@@ -1,39 +1,92 @@
 """Main CLI application with authentication and resource management."""
+import sys
 from src.services.resource_manager import ResourceManager
-from src.services.user_repository import UserRepository
+from src.patterns.resource_decorator import synchronous_logs
+from src.services.user_repository import UserRepository, User
 from src.services.login_service import FileLogin, ServiceLogin
+from src.cli._fields import prompt_fields
+from src.cli._specs import RESOURCE_SPECS
+from src.cli._logging import configure_logging
 
 
 class CloudResourceManagerApp:
     """Main application with user authentication."""
     
     def __init__(self):
-        # Initialize repository and login service
-        self.user_repo = UserRepository("data/users.json")
-        self.file_login = FileLogin(self.user_repo)
-        
-        # Initialize resource manager with file-based login
-        self.manager = ResourceManager(self.user_repo, self.file_login)
-        
-        # Create default admin user if repository is empty
-        self._initialize_default_users()
+        # Repository, login service and resource manager are built on first use
+        self._user_repo = None
+        self._file_login = None
+        self._manager = None
+        self._resource_types = None
+        
+        self._auth_menu = {
+            "1": self.handle_login,
+            "2": self.handle_register,
+            "3": self.switch_to_service_login,
+            "4": self.handle_exit,
+        }
+        self._main_menu = {
+            "1": self.create_resource,
+            "2": self.list_resources,
+            "3": self.start_resource,
+            "4": self.stop_resource,
+            "5": self.delete_resource,
+            "6": self.view_details,
+            "7": self.handle_logout,
+            "8": self.handle_exit,
+        }
+    
+    @property
+    def user_repo(self) -> UserRepository:
+        """User repository, loaded on first use."""
+        if self._user_repo is None:
+            self._user_repo = UserRepository("data/users.json")
+            # Create default admin user if repository is empty
+            self._initialize_default_users()
+        return self._user_repo
+    
+    @property
+    def file_login(self) -> FileLogin:
+        """File-based login service, created on first use."""
+        if self._file_login is None:
+            self._file_login = FileLogin(self.user_repo)
+        return self._file_login
+    
+    @property
+    def manager(self) -> ResourceManager:
+        """Resource manager using file-based login, created on first use."""
+        if self._manager is None:
+            self._manager = ResourceManager(self.user_repo, self.file_login)
+        return self._manager
+    
+    @property
+    def resource_types(self):
+        """Registered resource type names, read from the factory once."""
+        if self._resource_types is None:
+            self._resource_types = tuple(self.manager.factory.list_available_types())
+        return self._resource_types
     
     def _initialize_default_users(self):
         """Create default users if none exist."""
         users = self.user_repo.get_all_users()
         if not users:
             print("Initializing default users...")
-            self.user_repo.add_user(User("admin", "admin123", "admin"))
-            self.user_repo.add_user(User("user", "user123", "user"))
+            with self.user_repo.batch():
+                self.user_repo.add_user(User("admin", "admin123", "admin"))
+                self.user_repo.add_user(User("user", "user123", "user"))
             print("Default users created: admin/admin123, user/user123")
     
     def run(self):
         """Run the main menu loop."""
-        while True:
-            if not self.manager.is_authenticated():
-                self.show_auth_menu()
-            else:
-                self.show_main_menu()
+        # Decorator logs are written synchronously so they land before the next prompt
+        with synchronous_logs():
+            while True:
+                # Checked without self.manager so nothing is built until the user
+                # picks an option that needs it
+                if self._manager is None or not self._manager.is_authenticated():
+                    self.show_auth_menu()
+                else:
+                    self.show_main_menu()
     
     def show_auth_menu(self):
         """Show authentication menu."""
@@ -48,15 +101,9 @@ class CloudResourceManagerApp:
         choice = input("\nEnter your choice: ").strip()
         
         try:
-            if choice == "1":
-                self.handle_login()
-            elif choice == "2":
-                self.handle_register()
-            elif choice == "3":
-                self.switch_to_service_login()
-            elif choice == "4":
-                print("Exiting...")
-                exit(0)
+            handler = self._auth_menu.get(choice)
+            if handler:
+                handler()
             else:
                 print("Invalid choice. Please try again.")
         except Exception as e:
@@ -80,23 +127,9 @@ class CloudResourceManagerApp:
         choice = input("\nEnter your choice: ").strip()
         
         try:
-            if choice == "1":
-                self.create_resource()
-            elif choice == "2":
-                self.list_resources()
-            elif choice == "3":
-                self.start_resource()
-            elif choice == "4":
-                self.stop_resource()
-            elif choice == "5":
-                self.delete_resource()
-            elif choice == "6":
-                self.view_details()
-            elif choice == "7":
-                self.manager.logout()
-            elif choice == "8":
-                print("Exiting...")
-                exit(0)
+            handler = self._main_menu.get(choice)
+            if handler:
+                handler()
             else:
                 print("Invalid choice. Please try again.")
         except Exception as e:
@@ -118,6 +151,15 @@ class CloudResourceManagerApp:
         
         self.manager.register_user(username, password, role)
     
+    def handle_logout(self):
+        """Handle user logout."""
+        self.manager.logout()
+    
+    def handle_exit(self):
+        """Exit the application."""
+        print("Exiting...")
+        exit(0)
+    
     def switch_to_service_login(self):
         """Switch to service-based login (demo)."""
         print("\nSwitching to Service Login...")
@@ -133,7 +175,7 @@ class CloudResourceManagerApp:
     def create_resource(self):
         """Create a new resource."""
         print("\nAvailable resource types:")
-        types = self.manager.factory.list_available_types()
+        types = self.resource_types
         for i, rtype in enumerate(types, 1):
             print(f"{i}. {rtype}")
         
@@ -144,21 +186,10 @@ class CloudResourceManagerApp:
             print("Invalid selection")
             return
         
-        name = input("Enter resource name: ").strip()
-        
-        config = {'name': name}
+        # Either just the name, or the whole config as key=value pairs
+        first_line = input("Enter resource name (or key=value fields): ").strip()
         
-        if resource_type == "AppService":
-            config['runtime'] = input("Enter runtime (e.g., Python, Node.js): ").strip()
-            config['region'] = input("Enter region (e.g., us-east-1): ").strip()
-            config['replica_count'] = int(input("Enter replica count: ").strip())
-        elif resource_type == "StorageAccount":
-            config['encryption_enabled'] = input("Enable encryption? (y/n): ").strip().lower() == 'y'
-            config['max_size_gb'] = int(input("Enter max size (GB): ").strip())
-        elif resource_type == "CacheDB":
-            config['ttl_seconds'] = int(input("Enter TTL (seconds): ").strip())
-            config['capacity_mb'] = int(input("Enter capacity (MB): ").strip())
-            config['eviction_policy'] = input("Enter eviction policy (LRU/FIFO): ").strip().upper()
+        config = prompt_fields(first_line, RESOURCE_SPECS.get(resource_type, ()))
         
         enable_logging = input("Enable logging for this resource? (y/n): ").strip().lower() == 'y'
         
@@ -174,9 +205,10 @@ class CloudResourceManagerApp:
             print("\nNo resources available.")
             return
         
-        print("\nResources:")
-        for rid, resource in resources.items():
-            print(f"  [{rid}] {resource.name} - State: {resource.get_state()}")
+        lines = ["\nResources:"]
+        lines.extend(f"  [{rid}] {resource.name} - State: {resource.get_state()}"
+                     for rid, resource in resources.items())
+        sys.stdout.write("\n".join(lines) + "\n")
     
     def start_resource(self):
         """Start a resource."""
@@ -202,6 +234,6 @@ class CloudResourceManagerApp:
 
 
 if __name__ == "__main__":
-    from src.services.user_repository import User
+    configure_logging()
     app = CloudResourceManagerApp()
     app.run()
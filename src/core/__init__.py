@@ -1,10 +1,10 @@
 """Core domain models and business logic."""
 from .cloud_resource import CloudResource, AppService, StorageAccount, CacheDB
-from .resource_state import ResourceState, CreatedState, RunningState, StoppedState, DeletedState
+from .resource_state import State, Action, CREATED, RUNNING, STOPPED, DELETED
 from .eviction_strategy import EvictionStrategy, LRUStrategy, FIFOStrategy
 
 __all__ = [
     'CloudResource', 'AppService', 'StorageAccount', 'CacheDB',
-    'ResourceState', 'CreatedState', 'RunningState', 'StoppedState', 'DeletedState',
+    'State', 'Action', 'CREATED', 'RUNNING', 'STOPPED', 'DELETED',
     'EvictionStrategy', 'LRUStrategy', 'FIFOStrategy'
 ]
@@ -1,31 +1,49 @@
 """Core resource abstraction and concrete implementations."""
+import sys
 from abc import ABC, abstractmethod
-from src.core.resource_state import CreatedState
+from src.core.resource_state import CREATED, TRANSITIONS, Action
 from src.core.eviction_strategy import EvictionStrategy
 
 
 class CloudResource(ABC):
     """Abstract base class for all cloud resources."""
     
+    __slots__ = ('id', 'name', 'current_state')
+    
     def __init__(self, resource_id, name):
         self.id = resource_id
         self.name = name
-        self.current_state = CreatedState()
+        self.current_state = CREATED
     
     def start(self):
-        self.current_state.start(self)
+        self._transition(Action.START)
     
     def stop(self):
-        self.current_state.stop(self)
+        self._transition(Action.STOP)
     
     def delete(self):
-        self.current_state.delete(self)
+        self._transition(Action.DELETE)
+    
+    def _transition(self, action):
+        """Apply a lifecycle action using the state transition table."""
+        outcome = TRANSITIONS[self.current_state][action]
+        if isinstance(outcome, str):
+            raise ValueError(outcome)
+        next_state, verb = outcome
+        print(f"{verb} {self.name}...")
+        self.current_state = next_state
+    
+    @property
+    def state(self):
+        """Current State member; test it by identity, e.g. ``resource.state is RUNNING``."""
+        return self.current_state
     
     def set_state(self, state):
         self.current_state = state
     
     def get_state(self):
-        return self.current_state.get_state_name()
+        """Name of the current state, for display."""
+        return self.current_state.name
     
     @abstractmethod
     def get_details(self):
@@ -35,38 +53,63 @@ class CloudResource(ABC):
 class AppService(CloudResource):
     """Application Service resource."""
     
+    __slots__ = ('runtime', 'region', 'replica_count')
+    _DETAILS = "\n".join((
+        "AppService[{id}]: {name}",
+        "  State: {state}",
+        "  Runtime: {runtime}",
+        "  Region: {region}",
+        "  Replicas: {replicas}",
+    ))
+    
     def __init__(self, resource_id, name, runtime, region, replica_count):
         super().__init__(resource_id, name)
-        self.runtime = runtime
-        self.region = region
+        # Runtimes and regions come from a small set; share one string each
+        self.runtime = sys.intern(runtime) if isinstance(runtime, str) else runtime
+        self.region = sys.intern(region) if isinstance(region, str) else region
         self.replica_count = replica_count
     
     def get_details(self):
-        return (f"AppService[{self.id}]: {self.name}\n"
-                f"  State: {self.get_state()}\n"
-                f"  Runtime: {self.runtime}\n"
-                f"  Region: {self.region}\n"
-                f"  Replicas: {self.replica_count}")
+        return self._DETAILS.format(
+            id=self.id, name=self.name, state=self.get_state(),
+            runtime=self.runtime, region=self.region, replicas=self.replica_count)
 
 
 class StorageAccount(CloudResource):
     """Storage Account resource."""
     
+    __slots__ = ('encryption_enabled', 'max_size_gb')
+    _DETAILS = "\n".join((
+        "StorageAccount[{id}]: {name}",
+        "  State: {state}",
+        "  Encryption: {encryption}",
+        "  Max Size: {max_size}GB",
+    ))
+    
     def __init__(self, resource_id, name, encryption_enabled, max_size_gb):
         super().__init__(resource_id, name)
         self.encryption_enabled = encryption_enabled
         self.max_size_gb = max_size_gb
     
     def get_details(self):
-        return (f"StorageAccount[{self.id}]: {self.name}\n"
-                f"  State: {self.get_state()}\n"
-                f"  Encryption: {'Enabled' if self.encryption_enabled else 'Disabled'}\n"
-                f"  Max Size: {self.max_size_gb}GB")
+        return self._DETAILS.format(
+            id=self.id, name=self.name, state=self.get_state(),
+            encryption='Enabled' if self.encryption_enabled else 'Disabled',
+            max_size=self.max_size_gb)
 
 
 class CacheDB(CloudResource):
     """Cache Database resource."""
     
+    __slots__ = ('ttl_seconds', 'capacity_mb', 'eviction_policy')
+    _DETAILS = "\n".join((
+        "CacheDB[{id}]: {name}",
+        "  State: {state}",
+        "  TTL: {ttl}s",
+        "  Capacity: {capacity}MB",
+        "  Eviction: {eviction}",
+    ))
+    
     def __init__(self, resource_id, name, ttl_seconds, capacity_mb, eviction_policy: EvictionStrategy):
         super().__init__(resource_id, name)
         self.ttl_seconds = ttl_seconds
@@ -74,8 +117,7 @@ class CacheDB(CloudResource):
         self.eviction_policy = eviction_policy
     
     def get_details(self):
-        return (f"CacheDB[{self.id}]: {self.name}\n"
-                f"  State: {self.get_state()}\n"
-                f"  TTL: {self.ttl_seconds}s\n"
-                f"  Capacity: {self.capacity_mb}MB\n"
-                f"  Eviction: {self.eviction_policy.__class__.__name__}")
+        return self._DETAILS.format(
+            id=self.id, name=self.name, state=self.get_state(),
+            ttl=self.ttl_seconds, capacity=self.capacity_mb,
+            eviction=self.eviction_policy.__class__.__name__)
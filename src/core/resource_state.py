@@ -1,83 +1,47 @@
 """State Pattern implementation for resource lifecycle management."""
-from abc import ABC, abstractmethod
-
-
-class ResourceState(ABC):
-    """Abstract base class for resource states."""
-    
-    @abstractmethod
-    def start(self, resource):
-        pass
-    
-    @abstractmethod
-    def stop(self, resource):
-        pass
-    
-    @abstractmethod
-    def delete(self, resource):
-        pass
-    
-    @abstractmethod
-    def get_state_name(self):
-        pass
-
-
-class CreatedState(ResourceState):
-    def start(self, resource):
-        print(f"Starting {resource.name}...")
-        resource.set_state(RunningState())
-    
-    def stop(self, resource):
-        raise ValueError("Cannot stop a resource that hasn't been started")
-    
-    def delete(self, resource):
-        print(f"Deleting {resource.name}...")
-        resource.set_state(DeletedState())
-    
-    def get_state_name(self):
-        return "CREATED"
-
-
-class RunningState(ResourceState):
-    def start(self, resource):
-        raise ValueError("Resource is already running")
-    
-    def stop(self, resource):
-        print(f"Stopping {resource.name}...")
-        resource.set_state(StoppedState())
-    
-    def delete(self, resource):
-        raise ValueError("Cannot delete a running resource. Stop it first")
-    
-    def get_state_name(self):
-        return "RUNNING"
-
-
-class StoppedState(ResourceState):
-    def start(self, resource):
-        print(f"Restarting {resource.name}...")
-        resource.set_state(RunningState())
-    
-    def stop(self, resource):
-        raise ValueError("Resource is already stopped")
-    
-    def delete(self, resource):
-        print(f"Deleting {resource.name}...")
-        resource.set_state(DeletedState())
-    
-    def get_state_name(self):
-        return "STOPPED"
-
-
-class DeletedState(ResourceState):
-    def start(self, resource):
-        raise ValueError("Cannot start a deleted resource")
-    
-    def stop(self, resource):
-        raise ValueError("Cannot stop a deleted resource")
-    
-    def delete(self, resource):
-        raise ValueError("Resource is already deleted")
-    
-    def get_state_name(self):
-        return "DELETED"
+from enum import IntEnum
+
+
+class State(IntEnum):
+    """Lifecycle states of a cloud resource."""
+    
+    CREATED = 0
+    RUNNING = 1
+    STOPPED = 2
+    DELETED = 3
+
+
+class Action(IntEnum):
+    """Lifecycle operations that can be applied to a resource."""
+    
+    START = 0
+    STOP = 1
+    DELETE = 2
+
+
+CREATED = State.CREATED
+RUNNING = State.RUNNING
+STOPPED = State.STOPPED
+DELETED = State.DELETED
+
+
+# TRANSITIONS[state][action] is (next state, progress verb) for allowed
+# transitions, or the error message raised for rejected ones.
+TRANSITIONS = (
+    # CREATED
+    ((RUNNING, "Starting"),
+     "Cannot stop a resource that hasn't been started",
+     (DELETED, "Deleting")),
+    # RUNNING
+    ("Resource is already running",
+     (STOPPED, "Stopping"),
+     "Cannot delete a running resource. Stop it first"),
+    # STOPPED
+    ((RUNNING, "Restarting"),
+     "Resource is already stopped",
+     (DELETED, "Deleting")),
+    # DELETED
+    ("Cannot start a deleted resource",
+     "Cannot stop a deleted resource",
+     "Resource is already deleted"),
+)
@@ -1,70 +1,125 @@
 """Decorator Pattern implementation for logging."""
+import atexit
+import contextlib
+import logging
+import logging.handlers
+import queue
+import sys
 from src.core.cloud_resource import CloudResource
-from datetime import datetime
 
 
-class ResourceDecorator(CloudResource):
-    """Abstract decorator for cloud resources."""
-    
-    def __init__(self, wrapped_resource: CloudResource):
-        self.wrapped_resource = wrapped_resource
-        # Delegate attributes to wrapped resource
-        self.id = wrapped_resource.id
-        self.name = wrapped_resource.name
-        self.current_state = wrapped_resource.current_state
+# Resource operation log. Callers only enqueue records; a background listener
+# thread formats them and writes them to stdout.
+log = logging.getLogger(__name__)
+log.setLevel(logging.INFO)
+log.propagate = False
+
+
+class StdoutHandler(logging.StreamHandler):
+    """Stream handler that writes to whatever sys.stdout is at emit time."""
     
-    def start(self):
-        self.wrapped_resource.start()
+    def emit(self, record):
+        self.stream = sys.stdout
+        super().emit(record)
+
+
+_log_queue = queue.SimpleQueue()
+_stdout_handler = StdoutHandler()
+_stdout_handler.setFormatter(
+    logging.Formatter("[LOG %(asctime)s] %(message)s", datefmt="%Y-%m-%d %H:%M:%S"))
+_listener = logging.handlers.QueueListener(_log_queue, _stdout_handler)
+_listener.start()
+atexit.register(_listener.stop)
+_queue_handler = logging.handlers.QueueHandler(_log_queue)
+log.addHandler(_queue_handler)
+
+
+def flush_logs():
+    """Block until every queued log record has been written."""
+    _listener.stop()
+    _listener.start()
+
+
+@contextlib.contextmanager
+def synchronous_logs():
+    """Write log records as they are made, in step with surrounding output."""
+    flush_logs()
+    log.removeHandler(_queue_handler)
+    log.addHandler(_stdout_handler)
+    try:
+        yield
+    finally:
+        log.removeHandler(_stdout_handler)
+        log.addHandler(_queue_handler)
+
+
+def logging_enabled() -> bool:
+    """Check whether LoggingDecorator output would currently be emitted."""
+    return log.isEnabledFor(logging.INFO)
+
+
+class ResourceDecorator:
+    """Abstract decorator for cloud resources.
     
-    def stop(self):
-        self.wrapped_resource.stop()
+    Anything a decorator does not override is looked up on, and assigned
+    to, the wrapped resource. The class is registered as a virtual
+    CloudResource subclass instead of inheriting from it, so inherited
+    implementations never shadow that delegation.
+    """
     
-    def delete(self):
-        self.wrapped_resource.delete()
+    __slots__ = ('wrapped_resource',)
     
-    def get_details(self):
-        return self.wrapped_resource.get_details()
+    def __init__(self, wrapped_resource: CloudResource):
+        self.wrapped_resource = wrapped_resource
     
-    def set_state(self, state):
-        self.wrapped_resource.set_state(state)
+    def __getattr__(self, name):
+        # copy and pickle probe the instance before wrapped_resource is set
+        if name == 'wrapped_resource':
+            raise AttributeError(name)
+        return getattr(self.wrapped_resource, name)
     
-    def get_state(self):
-        return self.wrapped_resource.get_state()
+    def __setattr__(self, name, value):
+        # The decorator's own slots and properties stay on the decorator
+        if hasattr(type(self), name):
+            object.__setattr__(self, name, value)
+        else:
+            setattr(self.wrapped_resource, name, value)
+
+
+CloudResource.register(ResourceDecorator)
 
 
 class LoggingDecorator(ResourceDecorator):
     """Decorator that adds logging to resource operations."""
     
+    __slots__ = ()
+    
     def __init__(self, wrapped_resource: CloudResource):
         super().__init__(wrapped_resource)
     
-    def _log(self, message):
-        timestamp = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-        print(f"[LOG {timestamp}] {message}")
-    
     def start(self):
-        self._log(f"Attempting to start resource: {self.name}")
+        log.info("Attempting to start resource: %s", self.name)
         try:
             self.wrapped_resource.start()
-            self._log(f"Successfully started resource: {self.name}")
+            log.info("Successfully started resource: %s", self.name)
         except Exception as e:
-            self._log(f"Failed to start resource: {self.name} - {str(e)}")
+            log.error("Failed to start resource: %s - %s", self.name, e)
             raise
     
     def stop(self):
-        self._log(f"Attempting to stop resource: {self.name}")
+        log.info("Attempting to stop resource: %s", self.name)
         try:
             self.wrapped_resource.stop()
-            self._log(f"Successfully stopped resource: {self.name}")
+            log.info("Successfully stopped resource: %s", self.name)
         except Exception as e:
-            self._log(f"Failed to stop resource: {self.name} - {str(e)}")
+            log.error("Failed to stop resource: %s - %s", self.name, e)
             raise
     
     def delete(self):
-        self._log(f"Attempting to delete resource: {self.name}")
+        log.info("Attempting to delete resource: %s", self.name)
         try:
             self.wrapped_resource.delete()
-            self._log(f"Successfully deleted resource: {self.name}")
+            log.info("Successfully deleted resource: %s", self.name)
         except Exception as e:
-            self._log(f"Failed to delete resource: {self.name} - {str(e)}")
+            log.error("Failed to delete resource: %s - %s", self.name, e)
             raise
@@ -1,63 +1,96 @@
 """Factory Method with Registry for dynamic resource creation."""
+import logging
+import sys
+from functools import partial
+from typing import Callable, Dict, Tuple
 from src.core.cloud_resource import CloudResource, AppService, StorageAccount, CacheDB
 from src.core.eviction_strategy import LRUStrategy, FIFOStrategy
 
+log = logging.getLogger(__name__)
+
+
+def _build_from_config(resource_class, config):
+    """Default builder: pass every field except id/name as a keyword argument."""
+    fields = {key: value for key, value in config.items() if key not in ('id', 'name')}
+    return resource_class(config['id'], config['name'], **fields)
+
+
+def _build_app_service(resource_class, config):
+    return resource_class(
+        config['id'],
+        config['name'],
+        config['runtime'],
+        config['region'],
+        config['replica_count']
+    )
+
+
+def _build_storage_account(resource_class, config):
+    return resource_class(
+        config['id'],
+        config['name'],
+        config['encryption_enabled'],
+        config['max_size_gb']
+    )
+
+
+def _build_cache_db(resource_class, config):
+    # Handle eviction strategy
+    eviction_policy = config.get('eviction_policy', 'LRU')
+    strategy = LRUStrategy() if eviction_policy == 'LRU' else FIFOStrategy()
+    return resource_class(
+        config['id'],
+        config['name'],
+        config['ttl_seconds'],
+        config['capacity_mb'],
+        strategy
+    )
+
 
 class ResourceFactory:
     """Factory for creating cloud resources with registry mechanism."""
     
     def __init__(self):
         self.registry = {}
+        # resource type -> callable taking a config dict and returning the resource
+        self._builders: Dict[str, Callable[[Dict], CloudResource]] = {}
+        self._types_tuple: Tuple[str, ...] = ()
         self._register_defaults()
     
     def _register_defaults(self):
-        """Register default resource types."""
-        self.register("AppService", AppService)
-        self.register("StorageAccount", StorageAccount)
-        self.register("CacheDB", CacheDB)
+        """Register default resource types that are not registered yet."""
+        for resource_type, resource_class, builder in (
+                ("AppService", AppService, _build_app_service),
+                ("StorageAccount", StorageAccount, _build_storage_account),
+                ("CacheDB", CacheDB, _build_cache_db)):
+            if resource_type not in self.registry:
+                self.register(resource_type, resource_class, builder)
     
-    def register(self, resource_type, resource_class):
-        """Register a new resource type."""
+    def register(self, resource_type, resource_class, builder=None):
+        """Register a new resource type.
+        
+        builder(resource_class, config) constructs the resource; by default
+        every config field other than id and name is passed by keyword.
+        """
+        if isinstance(resource_type, str):
+            resource_type = sys.intern(resource_type)
+        if resource_type not in self.registry:
+            self._types_tuple += (resource_type,)
         self.registry[resource_type] = resource_class
-        print(f"Registered resource type: {resource_type}")
+        self._builders[resource_type] = partial(builder or _build_from_config, resource_class)
+        log.debug("Registered resource type: %s", resource_type)
     
     def create_resource(self, resource_type, config):
         """Create a resource based on type and configuration."""
-        if resource_type not in self.registry:
+        builder = self._builders.get(resource_type)
+        if builder is None:
             raise ValueError(f"Unknown resource type: {resource_type}")
-        
-        resource_class = self.registry[resource_type]
-        
-        # Create resource based on type
-        if resource_type == "AppService":
-            return resource_class(
-                config['id'],
-                config['name'],
-                config['runtime'],
-                config['region'],
-                config['replica_count']
-            )
-        elif resource_type == "StorageAccount":
-            return resource_class(
-                config['id'],
-                config['name'],
-                config['encryption_enabled'],
-                config['max_size_gb']
-            )
-        elif resource_type == "CacheDB":
-            # Handle eviction strategy
-            eviction_policy = config.get('eviction_policy', 'LRU')
-            strategy = LRUStrategy() if eviction_policy == 'LRU' else FIFOStrategy()
-            return resource_class(
-                config['id'],
-                config['name'],
-                config['ttl_seconds'],
-                config['capacity_mb'],
-                strategy
-            )
-        else:
-            raise ValueError(f"Cannot instantiate resource type: {resource_type}")
+        return builder(config)
     
     def list_available_types(self):
-        """List all registered resource types."""
-        return list(self.registry.keys())
+        """List all registered resource types, in registration order."""
+        return self._types_tuple
+
+
+# Shared by ResourceManagers that are not given a factory of their own
+DEFAULT_FACTORY = ResourceFactory()
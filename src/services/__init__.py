@@ -1,6 +1,8 @@
 """Service layer for authentication and resource management."""
 from .user_repository import User, UserRepository
 from .login_service import LoginService, FileLogin, ServiceLogin
+from .session_store import SessionStore
 from .resource_manager import ResourceManager
 
-__all__ = ['User', 'UserRepository', 'LoginService', 'FileLogin', 'ServiceLogin', 'ResourceManager']
+__all__ = ['User', 'UserRepository', 'LoginService', 'FileLogin', 'ServiceLogin', 'SessionStore',
+           'ResourceManager']
@@ -0,0 +1,25 @@
+"""Bulk password verification for checking many users at once."""
+import os
+from concurrent.futures import ThreadPoolExecutor
+from typing import Iterable, List, Optional, Tuple
+from src.services.user_repository import verify_password
+
+
+def _verify_pair(pair: Tuple[Optional[str], str]) -> bool:
+    stored_hash, password = pair
+    return stored_hash is not None and verify_password(stored_hash, password)
+
+
+def verify_many(pairs: Iterable[Tuple[Optional[str], str]],
+                max_workers: Optional[int] = None) -> List[bool]:
+    """Verify (stored hash, password) pairs in parallel, keeping input order.
+
+    A stored hash of None (an unknown user) never matches. hashlib.scrypt
+    releases the GIL, so the key derivations run concurrently across threads.
+    """
+    pairs = list(pairs)
+    if len(pairs) < 2:
+        return [_verify_pair(pair) for pair in pairs]
+    workers = max_workers or min(len(pairs), os.cpu_count() or 1)
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        return list(executor.map(_verify_pair, pairs))
@@ -1,7 +1,8 @@
 """Login service classes for authentication."""
 from abc import ABC, abstractmethod
-from typing import Optional
-from src.services.user_repository import UserRepository, User
+from typing import Dict, Iterable, List, Optional, Tuple
+from src.services.user_repository import UserRepository, User, verify_password
+from src.services.bulk_auth import verify_many
 
 
 class LoginService(ABC):
@@ -12,6 +13,14 @@ class LoginService(ABC):
         """Authenticate a user."""
         pass
     
+    def authenticate_record(self, repository: UserRepository, username: str, password: str,
+                            user_data: Optional[Dict]) -> bool:
+        """Authenticate a user whose record was already read from ``repository``.
+        
+        Services that do not check the repository ignore the record.
+        """
+        return self.authenticate(username, password)
+    
     @abstractmethod
     def get_service_name(self) -> str:
         """Get the name of the login service."""
@@ -26,19 +35,36 @@ class FileLogin(LoginService):
     
     def authenticate(self, username: str, password: str) -> bool:
         """Authenticate user against file-based storage."""
-        user = self.repository.find_by_username(username)
-        
-        if user is None:
+        return self._check_record(username, password, self.repository.get_raw(username))
+    
+    def authenticate_record(self, repository: UserRepository, username: str, password: str,
+                            user_data: Optional[Dict]) -> bool:
+        """Authenticate against a record from our repository without looking it up again."""
+        if repository is not self.repository:
+            return self.authenticate(username, password)
+        return self._check_record(username, password, user_data)
+    
+    def _check_record(self, username: str, password: str, user_data: Optional[Dict]) -> bool:
+        """Verify a password against a user's stored record."""
+        if user_data is None:
             print(f"[FileLogin] User '{username}' not found")
             return False
         
-        if user.password == password:
+        if verify_password(user_data["password"], password):
             print(f"[FileLogin] User '{username}' authenticated successfully")
             return True
         else:
             print(f"[FileLogin] Invalid password for user '{username}'")
             return False
     
+    def authenticate_many(self, credentials: Iterable[Tuple[str, str]]) -> List[bool]:
+        """Authenticate (username, password) pairs at once, e.g. for an import."""
+        pairs = []
+        for username, password in credentials:
+            user_data = self.repository.get_raw(username)
+            pairs.append((user_data["password"] if user_data is not None else None, password))
+        return verify_many(pairs)
+    
     def get_service_name(self) -> str:
         return "File-Based Authentication"
 
@@ -1,41 +1,157 @@
 """Resource Manager with Repository pattern integration."""
-from typing import Dict, Optional
+import hashlib
+import hmac
+import itertools
+import logging
+import secrets
+import time
+import types
+from functools import wraps
+from typing import Any, Callable, Dict, Iterable, List, Mapping, Optional, Tuple
 from src.core.cloud_resource import CloudResource
-from src.patterns.resource_factory import ResourceFactory
-from src.patterns.resource_decorator import LoggingDecorator
+from src.patterns.resource_factory import ResourceFactory, DEFAULT_FACTORY
+from src.patterns.resource_decorator import LoggingDecorator, logging_enabled
 from src.services.user_repository import UserRepository, User
 from src.services.login_service import LoginService, FileLogin
+from src.services.session_store import SessionStore
+
+log = logging.getLogger(__name__)
+
+# Log message templates, formatted by logging only when the level is enabled
+_LOGIN_REQUIRED = "Error: You must be logged in to %s"
+_NOT_FOUND = "Resource %s not found"
+
+
+def require_auth(action: str, default=None, default_factory: Optional[Callable[[], Any]] = None):
+    """Make a ResourceManager method return ``default`` unless a user is logged in.
+    
+    Use ``default_factory`` for mutable defaults, so each call gets a fresh one.
+    """
+    def decorator(method):
+        @wraps(method)
+        def wrapper(self, *args, **kwargs):
+            if self.current_user is None:
+                log.error(_LOGIN_REQUIRED, action)
+                return default_factory() if default_factory is not None else default
+            return method(self, *args, **kwargs)
+        return wrapper
+    return decorator
 
 
 class ResourceManager:
     """Manages cloud resources with user authentication and repository pattern."""
     
-    def __init__(self, user_repository: UserRepository, login_service: LoginService):
+    AUTH_CACHE_TTL = 300.0
+    
+    def __init__(self, user_repository: UserRepository, login_service: LoginService,
+                 auth_cache_ttl: float = AUTH_CACHE_TTL, factory: Optional[ResourceFactory] = None,
+                 sessions: Optional[SessionStore] = None):
         self.user_repository = user_repository
+        self.auth_cache_ttl = auth_cache_ttl
+        # Pass a shared store to let another manager resume a login by token
+        self.sessions = sessions if sessions is not None else SessionStore()
+        # Token for the current login; pass it to login_with_token() to resume
+        self.session_token: Optional[str] = None
+        # username -> (keyed password digest, stored password hash, monotonic expiry)
+        self._auth_cache: Dict[str, Tuple[bytes, str, float]] = {}
+        self._auth_key = secrets.token_bytes(32)
         self.login_service = login_service
-        self.factory = ResourceFactory()
+        # Types registered on the default factory are visible to every manager using it
+        self.factory = factory or DEFAULT_FACTORY
         self.resources: Dict[str, CloudResource] = {}
-        self.next_id = 1
+        self._resources_view: Mapping[str, CloudResource] = types.MappingProxyType(self.resources)
+        self._id_gen = itertools.count(1)
         self.current_user: Optional[User] = None
     
+    @property
+    def login_service(self) -> LoginService:
+        return self._login_service
+    
+    @login_service.setter
+    def login_service(self, login_service: LoginService):
+        # Credentials verified by one service say nothing about another
+        self._login_service = login_service
+        self._auth_cache.clear()
+    
+    def _password_digest(self, password: str) -> bytes:
+        """Hash a password for the auth cache; plaintext is never cached."""
+        return hmac.new(self._auth_key, password.encode(), hashlib.sha256).digest()
+    
+    def _is_cached_login(self, username: str, user_data: Optional[Dict], digest: bytes) -> bool:
+        """Check a login against the auth cache, dropping stale entries.
+        
+        ``user_data`` is the user's current record, so a password changed
+        elsewhere, even by another process, invalidates the entry.
+        """
+        entry = self._auth_cache.get(username)
+        if entry is None:
+            return False
+        cached_digest, password_hash, expiry = entry
+        if (user_data is None or time.monotonic() >= expiry
+                or not hmac.compare_digest(password_hash, user_data["password"])):
+            del self._auth_cache[username]
+            return False
+        return hmac.compare_digest(cached_digest, digest)
+    
     def login(self, username: str, password: str) -> bool:
         """Login a user using the configured login service."""
-        if self.login_service.authenticate(username, password):
-            self.current_user = self.user_repository.find_by_username(username)
-            if self.current_user is None:
-                print(f"Warning: User '{username}' authenticated but not found in repository")
+        # Read first: this picks up changes made to the file by other writers
+        user_data = self.user_repository.get_raw(username)
+        digest = self._password_digest(password)
+        if (self._is_cached_login(username, user_data, digest)
+                or self.login_service.authenticate_record(self.user_repository, username, password, user_data)):
+            if user_data is None:
+                self.current_user = None
+                log.warning("Warning: User '%s' authenticated but not found in repository", username)
                 return False
-            print(f"Welcome, {self.current_user.username} ({self.current_user.role})")
+            self.current_user = User.from_dict(user_data)
+            self._auth_cache[username] = (
+                digest, user_data["password"], time.monotonic() + self.auth_cache_ttl)
+            # The previous login's token ends with it
+            if self.session_token is not None:
+                self.sessions.revoke(self.session_token)
+            self.session_token = self.sessions.issue(user_data, self.login_service)
+            log.info("Welcome, %s (%s)", self.current_user.username, self.current_user.role)
             return True
         return False
     
+    def login_with_token(self, token: str) -> bool:
+        """Resume a session from a token issued by login(), skipping the password check."""
+        entry = self.sessions.lookup(token)
+        # Credentials verified by one service say nothing about another
+        if entry is not None and entry[2] is self.login_service:
+            username, password_hash, _ = entry
+            user_data = self.user_repository.get_raw(username)
+            if user_data is not None and hmac.compare_digest(user_data["password"], password_hash):
+                self.current_user = User.from_dict(user_data)
+                self.session_token = token
+                log.info("Welcome, %s (%s)", self.current_user.username, self.current_user.role)
+                return True
+            # The user was removed or changed password since the session began
+            self.sessions.revoke(token)
+        log.warning("Invalid or expired session token")
+        return False
+    
     def logout(self):
-        """Logout the current user."""
+        """Logout the current user and end their session token."""
         if self.current_user:
-            print(f"User '{self.current_user.username}' logged out")
+            log.info("User '%s' logged out", self.current_user.username)
             self.current_user = None
+            if self.session_token is not None:
+                self.sessions.revoke(self.session_token)
+            self.session_token = None
         else:
-            print("No user is currently logged in")
+            log.info("No user is currently logged in")
+    
+    def revoke_session(self, token: Optional[str] = None):
+        """Invalidate a session token, by default the current one, and log out its user."""
+        token = token or self.session_token
+        if token is None:
+            return
+        self.sessions.revoke(token)
+        if token == self.session_token:
+            self.current_user = None
+            self.session_token = None
     
     def is_authenticated(self) -> bool:
         """Check if a user is currently authenticated."""
@@ -45,93 +161,97 @@ class ResourceManager:
         """Register a new user in the repository."""
         user = User(username, password, role)
         if self.user_repository.add_user(user):
-            print(f"User '{username}' registered successfully")
+            log.info("User '%s' registered successfully", username)
             return True
         else:
-            print(f"User '{username}' already exists")
+            log.warning("User '%s' already exists", username)
             return False
     
+    @require_auth("create resources", default=None)
     def create_resource(self, resource_type: str, config: Dict, enable_logging: bool = False) -> Optional[str]:
         """Create a new cloud resource."""
-        if not self.is_authenticated():
-            print("Error: You must be logged in to create resources")
-            return None
-        
-        config['id'] = str(self.next_id)
-        resource = self.factory.create_resource(resource_type, config)
+        resource_id = str(next(self._id_gen))
+        # Copy rather than write the ID into the caller's dict
+        resource = self.factory.create_resource(resource_type, {**config, 'id': resource_id})
         
-        if enable_logging:
+        # Not worth wrapping if the decorator's log output is switched off
+        if enable_logging and logging_enabled():
             resource = LoggingDecorator(resource)
         
-        resource_id = str(self.next_id)
         self.resources[resource_id] = resource
-        self.next_id += 1
         
-        print(f"Resource created with ID: {resource_id} by user: {self.current_user.username}")
+        log.info("Resource created with ID: %s by user: %s", resource_id, self.current_user.username)
         return resource_id
     
+    @require_auth("create resources", default_factory=list)
+    def create_resources(self, specs: Iterable[Tuple[str, Dict, bool]]) -> List[str]:
+        """Create several resources from (type, config, enable_logging) specs.
+        
+        Nothing is added unless every resource is built successfully.
+        """
+        specs = list(specs)
+        if not specs:
+            return []
+        resource_ids = [str(next(self._id_gen)) for _ in specs]
+        enable_logging = logging_enabled()
+        built = {}
+        for resource_id, (resource_type, config, wrap) in zip(resource_ids, specs):
+            resource = self.factory.create_resource(resource_type, {**config, 'id': resource_id})
+            built[resource_id] = LoggingDecorator(resource) if wrap and enable_logging else resource
+        
+        self.resources.update(built)
+        
+        log.info("Created %d resources by user: %s", len(resource_ids), self.current_user.username)
+        return resource_ids
+    
     def get_resource(self, resource_id: str) -> Optional[CloudResource]:
         """Get a resource by ID."""
         return self.resources.get(resource_id)
     
-    def list_resources(self) -> Dict[str, CloudResource]:
-        """List all resources."""
-        if not self.is_authenticated():
-            print("Error: You must be logged in to list resources")
-            return {}
-        return self.resources
+    @require_auth("list resources", default=types.MappingProxyType({}))
+    def list_resources(self) -> Mapping[str, CloudResource]:
+        """List all resources as a read-only view."""
+        return self._resources_view
     
+    @require_auth("start resources", default=False)
     def start_resource(self, resource_id: str) -> bool:
         """Start a resource."""
-        if not self.is_authenticated():
-            print("Error: You must be logged in to start resources")
-            return False
-        
         resource = self.get_resource(resource_id)
         if resource:
             resource.start()
             return True
         else:
-            print(f"Resource {resource_id} not found")
+            log.warning(_NOT_FOUND, resource_id)
             return False
     
+    @require_auth("stop resources", default=False)
     def stop_resource(self, resource_id: str) -> bool:
         """Stop a resource."""
-        if not self.is_authenticated():
-            print("Error: You must be logged in to stop resources")
-            return False
-        
         resource = self.get_resource(resource_id)
         if resource:
             resource.stop()
             return True
         else:
-            print(f"Resource {resource_id} not found")
+            log.warning(_NOT_FOUND, resource_id)
             return False
     
+    @require_auth("delete resources", default=False)
     def delete_resource(self, resource_id: str) -> bool:
         """Delete a resource."""
-        if not self.is_authenticated():
-            print("Error: You must be logged in to delete resources")
-            return False
-        
         resource = self.get_resource(resource_id)
         if resource:
             resource.delete()
             return True
         else:
-            print(f"Resource {resource_id} not found")
+            log.warning(_NOT_FOUND, resource_id)
             return False
     
+    @require_auth("view resource details", default=None)
     def get_resource_details(self, resource_id: str) -> Optional[str]:
         """Get detailed information about a resource."""
-        if not self.is_authenticated():
-            print("Error: You must be logged in to view resource details")
-            return None
-        
         resource = self.get_resource(resource_id)
         if resource:
             return resource.get_details()
         else:
-            print(f"Resource {resource_id} not found")
+            log.warning(_NOT_FOUND, resource_id)
             return None
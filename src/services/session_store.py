@@ -0,0 +1,49 @@
+"""Session tokens that let a login be resumed without the password."""
+import secrets
+import time
+from typing import Any, Dict, Optional, Tuple
+
+
+class SessionStore:
+    """Issues and checks login session tokens.
+    
+    Each ResourceManager has its own store unless one is passed in. Sharing a
+    store lets a token resume the login on another manager, but only under
+    the login service that issued it.
+    """
+    
+    SESSION_TTL = 3600.0
+    
+    def __init__(self, ttl: float = SESSION_TTL):
+        self.ttl = ttl
+        # token -> (username, password hash at login, issuing login service, monotonic expiry)
+        self._sessions: Dict[str, Tuple[str, str, Any, float]] = {}
+    
+    def _prune(self, now: float):
+        """Drop every expired session."""
+        expired = [token for token, entry in self._sessions.items() if now >= entry[-1]]
+        for token in expired:
+            del self._sessions[token]
+    
+    def issue(self, user_data: Dict, issuer: Any) -> str:
+        """Start a session for a user authenticated by ``issuer`` and return its token."""
+        now = time.monotonic()
+        self._prune(now)
+        token = secrets.token_urlsafe(32)
+        self._sessions[token] = (user_data["username"], user_data["password"], issuer, now + self.ttl)
+        return token
+    
+    def lookup(self, token: str) -> Optional[Tuple[str, str, Any]]:
+        """Return (username, password hash at login, issuer) for a live token, or None."""
+        entry = self._sessions.get(token)
+        if entry is None:
+            return None
+        username, password_hash, issuer, expiry = entry
+        if time.monotonic() >= expiry:
+            del self._sessions[token]
+            return None
+        return username, password_hash, issuer
+    
+    def revoke(self, token: str):
+        """End a session so its token can no longer be used."""
+        self._sessions.pop(token, None)
@@ -1,16 +1,84 @@
 """Repository Pattern implementation for user data persistence."""
+import atexit
+import contextlib
+import hashlib
+import hmac
 import json
 import os
+import re
+import sys
+import weakref
 from typing import Optional, Dict, List
 
+# JSON codec, chosen once at import: orjson when installed, else stdlib json.
+# Both produce the same two-space indented layout.
+try:
+    import orjson
+    
+    _loads = orjson.loads
+    
+    def _dumps(data: Dict) -> bytes:
+        """Serialize data as indented JSON bytes."""
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2)
+except ImportError:
+    _loads = json.loads
+    
+    def _dumps(data: Dict) -> bytes:
+        """Serialize data as indented JSON bytes."""
+        return json.dumps(data, indent=2).encode()
+
+
+_HASH_PREFIX = "scrypt$"
+# scrypt$<16-byte salt>$<64-byte digest>, both hex encoded
+_HASH_RE = re.compile(r"scrypt\$[0-9a-f]{32}\$[0-9a-f]{128}")
+_SCRYPT_PARAMS = {"n": 2 ** 14, "r": 8, "p": 1}
+
+
+def hash_password(password: str, salt: Optional[bytes] = None) -> str:
+    """Hash a password with scrypt as 'scrypt$<salt hex>$<hash hex>'."""
+    if salt is None:
+        salt = os.urandom(16)
+    digest = hashlib.scrypt(password.encode(), salt=salt, **_SCRYPT_PARAMS)
+    return f"{_HASH_PREFIX}{salt.hex()}${digest.hex()}"
+
+
+def is_password_hash(value: str) -> bool:
+    """Check whether a stored password is a complete hash from hash_password()."""
+    return _HASH_RE.fullmatch(value) is not None
+
+
+def verify_password(stored_hash: str, password: str) -> bool:
+    """Check a password against a stored hash in constant time."""
+    if not is_password_hash(stored_hash):
+        return False
+    salt_hex, _, _ = stored_hash[len(_HASH_PREFIX):].partition("$")
+    return hmac.compare_digest(hash_password(password, bytes.fromhex(salt_hex)), stored_hash)
+
 
 class User:
-    """User entity."""
+    """User entity.
+    
+    Passwords are hashed on assignment, so ``password`` always holds a hash.
+    Pass ``hashed=True`` when ``password`` is already a stored hash.
+    """
+    
+    __slots__ = ("username", "_password", "role")
     
-    def __init__(self, username: str, password: str, role: str = "user"):
+    def __init__(self, username: str, password: str, role: str = "user", hashed: bool = False):
         self.username = username
-        self.password = password
-        self.role = role
+        if hashed:
+            self._password = password
+        else:
+            self.password = password
+        self.role = sys.intern(role) if isinstance(role, str) else role
+    
+    @property
+    def password(self) -> str:
+        return self._password
+    
+    @password.setter
+    def password(self, password: str):
+        self._password = hash_password(password)
     
     def to_dict(self) -> Dict:
         """Convert user to dictionary."""
@@ -26,54 +94,158 @@ class User:
         return User(
             username=data["username"],
             password=data["password"],
-            role=data.get("role", "user")
+            role=data.get("role", "user"),
+            hashed=True
         )
 
 
+# Repositories with changes that may still need writing when the interpreter exits
+_open_repositories = weakref.WeakSet()
+
+
+@atexit.register
+def _flush_open_repositories():
+    """Write out pending changes of every repository still alive at exit."""
+    for repository in list(_open_repositories):
+        repository._flush_at_exit()
+
+
 class UserRepository:
-    """Repository for managing user data with JSON persistence."""
+    """Repository for managing user data with JSON persistence.
     
-    def __init__(self, filepath: str = "users.json"):
+    Login goes through get_raw(), so another storage backend must override
+    get_raw() (find_by_username() builds on it) and bump revision whenever
+    users change.
+    """
+    
+    # Bumped on every change so callers can tell cached user data is stale
+    revision = 0
+    
+    def __init__(self, filepath: str = "users.json", auto_flush: bool = True):
         self.filepath = filepath
+        # With auto_flush off, changes stay in memory until flush() is called
+        # (at the latest when the interpreter exits).
+        self.auto_flush = auto_flush
         self._ensure_file_exists()
+        self._mtime_ns = -1
+        self._dirty = False
+        self._set_data(self._load_data())
+        # Held weakly, so registering does not keep the repository alive
+        _open_repositories.add(self)
     
     def _ensure_file_exists(self):
         """Create the JSON file if it doesn't exist."""
         if not os.path.exists(self.filepath):
-            with open(self.filepath, 'w') as f:
-                json.dump({"users": []}, f, indent=2)
+            with open(self.filepath, 'wb') as f:
+                f.write(_dumps({"users": []}))
     
-    def _read_data(self) -> Dict:
+    def _file_mtime_ns(self) -> int:
+        """Modification time of the JSON file, or -1 if it is missing."""
+        try:
+            return os.stat(self.filepath).st_mtime_ns
+        except FileNotFoundError:
+            return -1
+    
+    def _load_data(self) -> Dict:
         """Read data from JSON file."""
-        with open(self.filepath, 'r') as f:
-            return json.load(f)
+        # Taken before reading, so a write racing the read triggers a reload
+        self._mtime_ns = self._file_mtime_ns()
+        with open(self.filepath, 'rb') as f:
+            return _loads(f.read())
+    
+    def _set_data(self, data: Dict):
+        """Replace the in-memory data and rebuild the username index."""
+        self._data = data
+        # username -> the user's record inside self._data["users"]
+        self._index: Dict[str, Dict] = {u["username"]: u for u in data["users"]}
+        self._upgrade_passwords()
+    
+    def _upgrade_passwords(self):
+        """Replace plaintext passwords from older files with hashes."""
+        legacy = [u for u in self._data["users"] if not is_password_hash(u["password"])]
+        for user_data in legacy:
+            user_data["password"] = hash_password(user_data["password"])
+        if legacy:
+            self._write_data(self._data)
+    
+    def _read_data(self) -> Dict:
+        """Return the user data, re-reading the file if it changed on disk."""
+        if not self._dirty:
+            mtime_ns = self._file_mtime_ns()
+            if mtime_ns != self._mtime_ns and mtime_ns != -1:
+                self.reload()
+        return self._data
+    
+    def reload(self):
+        """Re-read the JSON file, discarding changes that were not flushed."""
+        self._dirty = False
+        self._set_data(self._load_data())
+        self.revision += 1
     
     def _write_data(self, data: Dict):
-        """Write data to JSON file."""
-        with open(self.filepath, 'w') as f:
-            json.dump(data, f, indent=2)
+        """Record changed user data, writing it out unless flushing is deferred."""
+        self._data = data
+        self._dirty = True
+        self.revision += 1
+        if self.auto_flush:
+            self.flush()
+    
+    def flush(self):
+        """Write pending changes to the JSON file."""
+        if not self._dirty:
+            return
+        tmp_path = self.filepath + ".tmp"
+        with open(tmp_path, 'wb') as f:
+            f.write(_dumps(self._data))
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_path, self.filepath)
+        self._mtime_ns = self._file_mtime_ns()
+        self._dirty = False
+    
+    def _flush_at_exit(self):
+        """Flush at exit unless the file was changed since it was last read or written."""
+        # Another writer's newer file wins over a stale in-memory copy
+        if self._dirty and self._file_mtime_ns() in (self._mtime_ns, -1):
+            self.flush()
+    
+    @contextlib.contextmanager
+    def batch(self):
+        """Defer writes made inside the block and flush them once on exit."""
+        auto_flush = self.auto_flush
+        self.auto_flush = False
+        try:
+            yield self
+        finally:
+            self.auto_flush = auto_flush
+            self.flush()
     
     def add_user(self, user: User) -> bool:
         """Add a new user to the repository."""
         data = self._read_data()
         
         # Check if user already exists
-        if any(u["username"] == user.username for u in data["users"]):
+        if user.username in self._index:
             return False
         
-        data["users"].append(user.to_dict())
+        record = user.to_dict()
+        data["users"].append(record)
+        self._index[user.username] = record
         self._write_data(data)
         return True
     
     def find_by_username(self, username: str) -> Optional[User]:
         """Find a user by username."""
-        data = self._read_data()
-        
-        for user_data in data["users"]:
-            if user_data["username"] == username:
-                return User.from_dict(user_data)
+        user_data = self.get_raw(username)
+        return User.from_dict(user_data) if user_data is not None else None
+    
+    def get_raw(self, username: str) -> Optional[Dict]:
+        """Return the stored record for a username without building a User.
         
-        return None
+        The dict is the repository's own copy and must not be modified.
+        """
+        self._read_data()
+        return self._index.get(username)
     
     def get_all_users(self) -> List[User]:
         """Get all users."""
@@ -83,24 +255,23 @@ class UserRepository:
     def update_user(self, user: User) -> bool:
         """Update an existing user."""
         data = self._read_data()
+        user_data = self._index.get(user.username)
+        if user_data is None:
+            return False
         
-        for i, user_data in enumerate(data["users"]):
-            if user_data["username"] == user.username:
-                data["users"][i] = user.to_dict()
-                self._write_data(data)
-                return True
-        
-        return False
+        # Update in place so the list entry and the index stay the same object
+        user_data.clear()
+        user_data.update(user.to_dict())
+        self._write_data(data)
+        return True
     
     def delete_user(self, username: str) -> bool:
         """Delete a user by username."""
         data = self._read_data()
-        original_count = len(data["users"])
-        
-        data["users"] = [u for u in data["users"] if u["username"] != username]
-        
-        if len(data["users"]) < original_count:
-            self._write_data(data)
-            return True
+        user_data = self._index.pop(username, None)
+        if user_data is None:
+            return False
         
-        return False
+        data["users"] = [u for u in data["users"] if u is not user_data]
+        self._write_data(data)
+        return True